@@ -0,0 +1,33 @@
+import { describe, it, expect, beforeEach } from 'vitest';
+import { getCachedSearchEmbedding, cacheSearchEmbedding, _resetCache } from '../searchEmbeddingCache.js';
+
+beforeEach(() => {
+  _resetCache();
+});
+
+describe('searchEmbeddingCache', () => {
+  it('returns undefined for queries that were never cached', () => {
+    expect(getCachedSearchEmbedding('free will')).toBeUndefined();
+  });
+
+  it('returns the cached embedding for an exact query match', () => {
+    const embedding = [0.1, 0.2, 0.3];
+    cacheSearchEmbedding('free will', embedding);
+    expect(getCachedSearchEmbedding('free will')).toBe(embedding);
+    expect(getCachedSearchEmbedding('Free will')).toBeUndefined();
+  });
+
+  it('evicts the least recently used query once full', () => {
+    for (let i = 0; i < 500; i++) {
+      cacheSearchEmbedding(`query-${i}`, [i]);
+    }
+    // Touch the oldest entry so query-1 becomes the eviction candidate
+    expect(getCachedSearchEmbedding('query-0')).toEqual([0]);
+
+    cacheSearchEmbedding('query-500', [500]);
+
+    expect(getCachedSearchEmbedding('query-0')).toEqual([0]);
+    expect(getCachedSearchEmbedding('query-1')).toBeUndefined();
+    expect(getCachedSearchEmbedding('query-500')).toEqual([500]);
+  });
+});
@@ -0,0 +1,31 @@
+const MAX_ENTRIES = 500;
+
+// Query embeddings are deterministic for a given model, so repeated searches
+// can reuse them. Map iteration order is insertion order: hits are re-inserted
+// at the back, which leaves the least recently used entry first in line for eviction.
+const embeddings = new Map<string, number[]>();
+
+export function getCachedSearchEmbedding(query: string): number[] | undefined {
+  const embedding = embeddings.get(query);
+  if (embedding) {
+    embeddings.delete(query);
+    embeddings.set(query, embedding);
+  }
+  return embedding;
+}
+
+export function cacheSearchEmbedding(query: string, embedding: number[]): void {
+  embeddings.delete(query);
+  embeddings.set(query, embedding);
+  if (embeddings.size > MAX_ENTRIES) {
+    const oldest = embeddings.keys().next().value;
+    if (oldest !== undefined) {
+      embeddings.delete(oldest);
+    }
+  }
+}
+
+/** Reset cache — for testing only */
+export function _resetCache(): void {
+  embeddings.clear();
+}
@@ -373,13 +373,27 @@ export const createV3HypergraphRepo = (pool: Pool) => ({
     threshold: number = 0.85,
     limit: number = 3
   ): Promise<Array<V3ConceptNode & { similarity: number; sampleINodeText: string }>> {
-    // Use ORDER BY + LIMIT to allow the HNSW index to work optimally, then
-    // filter by threshold in JS. Over-fetch by 3x so the JS filter has enough
-    // candidates after pruning.
+    const [matches] = await this.findSimilarConceptsBatch([embedding], threshold, limit);
+    return matches ?? [];
+  },
+
+  /**
+   * Nearest-concept lookup for many embeddings in one round trip.
+   * Returns one candidate list per input embedding, in input order.
+   */
+  async findSimilarConceptsBatch(
+    embeddings: number[][],
+    threshold: number = 0.85,
+    limit: number = 3
+  ): Promise<Array<Array<V3ConceptNode & { similarity: number; sampleINodeText: string }>>> {
+    if (embeddings.length === 0) return [];
+
+    // Use ORDER BY + LIMIT per query embedding (LATERAL) to allow the HNSW index
+    // to work optimally, then filter by threshold in JS. Over-fetch by 3x so the
+    // JS filter has enough candidates after pruning.
     const fetchLimit = limit * 3;
     const result = await pool.query(
-      `SELECT c.id, c.term, c.definition, c.created_at,
-              (1 - (c.embedding <=> $1::vector)) as similarity,
+      `SELECT q.idx, c.id, c.term, c.definition, c.created_at, c.similarity,
               COALESCE(
                 (SELECT i.content FROM v3_i_node_concept_map m
                  JOIN v3_nodes_i i ON m.i_node_id = i.id
@@ -387,23 +401,34 @@ export const createV3HypergraphRepo = (pool: Pool) => ({
                  ORDER BY m.created_at ASC LIMIT 1),
                 ''
               ) as sample_i_node_text
-       FROM v3_concept_nodes c
-       WHERE c.embedding IS NOT NULL
-       ORDER BY c.embedding <=> $1::vector
-       LIMIT $2`,
-      [JSON.stringify(embedding), fetchLimit]
+       FROM unnest($1::text[]) WITH ORDINALITY AS q(embedding, idx)
+       CROSS JOIN LATERAL (
+         SELECT nc.id, nc.term, nc.definition, nc.created_at,
+                (1 - (nc.embedding <=> q.embedding::vector)) as similarity
+         FROM v3_concept_nodes nc
+         WHERE nc.embedding IS NOT NULL
+         ORDER BY nc.embedding <=> q.embedding::vector
+         LIMIT $2
+       ) c
+       ORDER BY q.idx, c.similarity DESC`,
+      [embeddings.map(e => JSON.stringify(e)), fetchLimit]
     );
-    return result.rows
-      .map(r => ({
+
+    const matches = embeddings.map(() => [] as Array<V3ConceptNode & { similarity: number; sampleINodeText: string }>);
+    for (const r of result.rows) {
+      const similarity = parseFloat(r.similarity);
+      const bucket = matches[Number(r.idx) - 1];
+      if (!bucket || similarity < threshold || bucket.length >= limit) continue;
+      bucket.push({
         id: r.id,
         term: r.term,
         definition: r.definition,
         created_at: r.created_at,
-        similarity: parseFloat(r.similarity),
+        similarity,
         sampleINodeText: r.sample_i_node_text,
-      }))
-      .filter(r => r.similarity >= threshold)
-      .slice(0, limit);
+      });
+    }
+    return matches;
   },
 
   async createConcept(
@@ -864,27 +889,60 @@ export const createV3HypergraphRepo = (pool: Pool) => ({
     threshold: number = 0.78,
     limit: number = 5
   ): Promise<Array<{ id: string; content: string; epistemic_type: string; similarity: number }>> {
+    const [matches] = await this.findSimilarINodesAcrossSourceBatch(
+      [embedding],
+      excludeSourceType,
+      excludeSourceId,
+      threshold,
+      limit
+    );
+    return matches ?? [];
+  },
+
+  /**
+   * Cross-source I-node candidate lookup for many embeddings in one round trip.
+   * Returns one candidate list per input embedding, in input order.
+   */
+  async findSimilarINodesAcrossSourceBatch(
+    embeddings: number[][],
+    excludeSourceType: 'post' | 'reply',
+    excludeSourceId: string,
+    threshold: number = 0.78,
+    limit: number = 5
+  ): Promise<Array<Array<{ id: string; content: string; epistemic_type: string; similarity: number }>>> {
+    if (embeddings.length === 0) return [];
+
     const fetchLimit = limit * 3;
     const result = await pool.query(
-      `SELECT id, content, epistemic_type,
-              (1 - (embedding <=> $1::vector)) as similarity
-       FROM v3_nodes_i
-       WHERE embedding IS NOT NULL
-         AND canonical_i_node_id IS NULL
-         AND NOT (source_type = $2 AND source_id = $3)
-       ORDER BY embedding <=> $1::vector
-       LIMIT $4`,
-      [JSON.stringify(embedding), excludeSourceType, excludeSourceId, fetchLimit]
+      `SELECT q.idx, n.id, n.content, n.epistemic_type, n.similarity
+       FROM unnest($1::text[]) WITH ORDINALITY AS q(embedding, idx)
+       CROSS JOIN LATERAL (
+         SELECT i.id, i.content, i.epistemic_type,
+                (1 - (i.embedding <=> q.embedding::vector)) as similarity
+         FROM v3_nodes_i i
+         WHERE i.embedding IS NOT NULL
+           AND i.canonical_i_node_id IS NULL
+           AND NOT (i.source_type = $2 AND i.source_id = $3)
+         ORDER BY i.embedding <=> q.embedding::vector
+         LIMIT $4
+       ) n
+       ORDER BY q.idx, n.similarity DESC`,
+      [embeddings.map(e => JSON.stringify(e)), excludeSourceType, excludeSourceId, fetchLimit]
     );
-    return result.rows
-      .map((r: { id: string; content: string; epistemic_type: string; similarity: string }) => ({
+
+    const matches = embeddings.map(() => [] as Array<{ id: string; content: string; epistemic_type: string; similarity: number }>);
+    for (const r of result.rows as Array<{ idx: string; id: string; content: string; epistemic_type: string; similarity: string }>) {
+      const similarity = parseFloat(r.similarity);
+      const bucket = matches[Number(r.idx) - 1];
+      if (!bucket || similarity < threshold || bucket.length >= limit) continue;
+      bucket.push({
         id: r.id,
         content: r.content,
         epistemic_type: r.epistemic_type,
-        similarity: parseFloat(r.similarity),
-      }))
-      .filter((r: { similarity: number }) => r.similarity >= threshold)
-      .slice(0, limit);
+        similarity,
+      });
+    }
+    return matches;
   },
 
   /**
@@ -120,6 +120,36 @@ describe('V3HypergraphRepo — findSimilarConcepts', () => {
   });
 });
 
+describe('V3HypergraphRepo — findSimilarConceptsBatch', () => {
+  beforeEach(async () => {
+    const repo = getRepo();
+    await repo.createConcept('democracy', 'Rule by the people', fakeEmbedding(10));
+    await repo.createConcept('monarchy', 'Rule by a monarch', fakeEmbedding(100));
+  });
+
+  it('returns one candidate list per embedding, in input order', async () => {
+    const repo = getRepo();
+    const results = await repo.findSimilarConceptsBatch(
+      [fakeEmbedding(100), fakeEmbedding(10), fakeEmbedding(500)],
+      0.85,
+      3
+    );
+
+    expect(results).toHaveLength(3);
+    expect(results[0]!.map(r => r.term)).toContain('monarchy');
+    expect(results[0]!.map(r => r.term)).not.toContain('democracy');
+    expect(results[1]!.map(r => r.term)).toContain('democracy');
+    expect(results[1]!.map(r => r.term)).not.toContain('monarchy');
+    // Orthogonal to both concepts → nothing above threshold
+    expect(results[2]!.filter(r => r.term === 'democracy' || r.term === 'monarchy')).toHaveLength(0);
+  });
+
+  it('returns an empty array for no embeddings', async () => {
+    const repo = getRepo();
+    expect(await repo.findSimilarConceptsBatch([], 0.85, 3)).toEqual([]);
+  });
+});
+
 describe('V3HypergraphRepo — linkINodeToConcept', () => {
   it('links an i-node to a concept', async () => {
     const repo = getRepo();
@@ -182,3 +212,32 @@ describe('V3HypergraphRepo — getConceptMapsForINodes', () => {
     expect(maps).toEqual([]);
   });
 });
+
+describe('V3HypergraphRepo — findSimilarINodesAcrossSourceBatch', () => {
+  it('returns per-embedding candidates in input order, excluding the analysed source', async () => {
+    const repo = getRepo();
+    const pool = globalThis.testDb.getPool();
+
+    const ownSourceId = uuidv4();
+    const otherINodeId = await createINode(await createRun());
+    const ownINodeId = await createINode(await createRun('post', ownSourceId), ownSourceId);
+    await pool.query(
+      `UPDATE v3_nodes_i SET embedding = $1 WHERE id = ANY($2::uuid[])`,
+      [JSON.stringify(fakeEmbedding(42)), [otherINodeId, ownINodeId]]
+    );
+
+    const results = await repo.findSimilarINodesAcrossSourceBatch(
+      [fakeEmbedding(7), fakeEmbedding(42)],
+      'post',
+      ownSourceId,
+      0.78,
+      5
+    );
+
+    expect(results).toHaveLength(2);
+    // fakeEmbedding(7) is orthogonal to both stored I-nodes
+    expect(results[0]!.map(r => r.id)).not.toContain(otherINodeId);
+    expect(results[1]!.map(r => r.id)).toContain(otherINodeId);
+    expect(results[1]!.map(r => r.id)).not.toContain(ownINodeId);
+  });
+});
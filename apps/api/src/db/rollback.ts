@@ -39,15 +39,16 @@ async function rollback(): Promise<void> {
     } finally {
       client.release();
     }
-  } catch (error) {
-    logger.error('Rollback failed', {
-      error: error instanceof Error ? error.message : String(error),
-    });
-    process.exit(1);
   } finally {
     await closePool();
   }
 }
 
-// Run if executed directly
-rollback();
+// Run if executed directly. Failures set the exit code rather than calling
+// process.exit() inside rollback(), so the pool is always closed first.
+rollback().catch((error) => {
+  logger.error('Rollback failed', {
+    error: error instanceof Error ? error.message : String(error),
+  });
+  process.exitCode = 1;
+});
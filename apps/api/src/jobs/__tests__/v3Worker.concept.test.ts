@@ -8,7 +8,7 @@ const mockV3Repo = vi.hoisted(() => ({
   createAnalysisRun: vi.fn(),
   updateRunStatus: vi.fn(),
   persistHypergraph: vi.fn(),
-  findSimilarConcepts: vi.fn(),
+  findSimilarConceptsBatch: vi.fn(),
   createConcept: vi.fn(),
   linkINodeToConcept: vi.fn(),
   getConceptMapsForINodes: vi.fn(),
@@ -132,7 +132,7 @@ beforeEach(() => {
   mockV3Repo.createAnalysisRun.mockResolvedValue({ id: 'run-1', status: 'pending' });
   mockV3Repo.updateRunStatus.mockResolvedValue(undefined);
   mockV3Repo.persistHypergraph.mockResolvedValue(new Map([['adu-1', 'db-inode-1']]));
-  mockV3Repo.findSimilarConcepts.mockResolvedValue([]);
+  mockV3Repo.findSimilarConceptsBatch.mockResolvedValue([]);
   mockV3Repo.createConcept.mockResolvedValue({
     id: 'concept-1',
     term: 'test',
@@ -203,7 +203,7 @@ describe('v3Worker — matchedConceptId validation', () => {
       embeddings_1536: [FAKE_EMBEDDING, FAKE_EMBEDDING],
     });
     // No candidates found in DB for 'equity'
-    mockV3Repo.findSimilarConcepts.mockResolvedValue([]);
+    mockV3Repo.findSimilarConceptsBatch.mockResolvedValue([]);
     // LLM hallucinated an unknown concept ID
     const hallucinatedId = 'unknown-concept-id-xyz';
     mockArgumentService.disambiguateConcepts.mockResolvedValue([
@@ -232,8 +232,8 @@ describe('v3Worker — matchedConceptId validation', () => {
       embeddings_1536: [FAKE_EMBEDDING, FAKE_EMBEDDING],
     });
     // DB returns one candidate with our validConceptId
-    mockV3Repo.findSimilarConcepts.mockResolvedValue([
-      { id: validConceptId, term: 'freedom', definition: 'Absence of coercion', sampleINodeText: 'some text' },
+    mockV3Repo.findSimilarConceptsBatch.mockResolvedValue([
+      [{ id: validConceptId, term: 'freedom', definition: 'Absence of coercion', sampleINodeText: 'some text' }],
     ]);
     // LLM matched to the valid candidate
     mockArgumentService.disambiguateConcepts.mockResolvedValue([
@@ -264,7 +264,7 @@ describe('v3Worker — novel concept creation', () => {
     mockArgumentService.embedTexts
       .mockResolvedValueOnce({ embeddings_1536: [FAKE_EMBEDDING, FAKE_EMBEDDING] }) // main embed
       .mockResolvedValueOnce({ embeddings_1536: [FAKE_EMBEDDING] }); // novel definition embed
-    mockV3Repo.findSimilarConcepts.mockResolvedValue([]);
+    mockV3Repo.findSimilarConceptsBatch.mockResolvedValue([]);
     mockArgumentService.disambiguateConcepts.mockResolvedValue([
       { term: 'sovereignty', matchedConceptId: null, newDefinition: 'Supreme authority over a territory' },
     ]);
@@ -319,3 +319,53 @@ describe('v3Worker — macro_context truncation', () => {
     expect((calledContext as string).length).toBeLessThanOrEqual(8000);
   });
 });
+
+describe('v3Worker — extracted value embeddings', () => {
+  it('issues the value embed call without waiting for the ADU/term call', async () => {
+    mockArgumentService.analyzeText.mockResolvedValue({
+      analyses: [{ ...makeAnalysis(), extracted_values: [{ source_node_id: 'adu-1', text: 'liberty' }] }],
+    });
+    let releaseAduTermCall!: () => void;
+    mockArgumentService.embedTexts
+      .mockImplementationOnce(() => new Promise(resolve => {
+        releaseAduTermCall = () => resolve({ embeddings_1536: [FAKE_EMBEDDING] });
+      }))
+      .mockResolvedValueOnce({ embeddings_1536: [FAKE_EMBEDDING] });
+
+    const job = makeJob();
+    const run = processV3Analysis(job as any);
+
+    await vi.waitFor(() => expect(mockArgumentService.embedTexts).toHaveBeenCalledTimes(2));
+    releaseAduTermCall();
+    await expect(run).resolves.toBeUndefined();
+
+    expect(mockArgumentService.embedTexts).toHaveBeenNthCalledWith(2, ['liberty']);
+    const valueEmbeddings = mockV3Repo.persistHypergraph.mock.calls[0]![5] as Map<string, number[]>;
+    expect(valueEmbeddings.get('liberty')).toBe(FAKE_EMBEDDING);
+  });
+});
+
+describe('v3Worker — extracted value deduplication', () => {
+  it('embeds each distinct value text once', async () => {
+    mockArgumentService.analyzeText.mockResolvedValue({
+      analyses: [{
+        ...makeAnalysis(),
+        extracted_values: [
+          { source_node_id: 'adu-1', text: 'liberty' },
+          { source_node_id: 'adu-2', text: 'equality' },
+          { source_node_id: 'adu-3', text: 'liberty' },
+        ],
+      }],
+    });
+    mockArgumentService.embedTexts
+      .mockResolvedValueOnce({ embeddings_1536: [FAKE_EMBEDDING] })
+      .mockResolvedValueOnce({ embeddings_1536: [FAKE_EMBEDDING, FAKE_EMBEDDING] });
+
+    const job = makeJob();
+    await processV3Analysis(job as any);
+
+    expect(mockArgumentService.embedTexts).toHaveBeenNthCalledWith(2, ['liberty', 'equality']);
+    const valueEmbeddings = mockV3Repo.persistHypergraph.mock.calls[0]![5] as Map<string, number[]>;
+    expect([...valueEmbeddings.keys()]).toEqual(['liberty', 'equality']);
+  });
+});
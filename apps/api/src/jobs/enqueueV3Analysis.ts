@@ -39,6 +39,9 @@ export async function enqueueV3Analysis(
     backoff: {
       type: 'exponential',
       delay: 1000,
+      // Spread retries so jobs that failed together (e.g. on a Gemini rate limit)
+      // don't all hit the discourse engine again at the same instant
+      jitter: 0.5,
     },
   });
 
@@ -9,7 +9,7 @@ export const v3Queue = new Queue('v3-analysis', {
   connection,
   defaultJobOptions: {
     attempts: 3,
-    backoff: { type: 'exponential', delay: 5000 },
+    backoff: { type: 'exponential', delay: 5000, jitter: 0.5 },
     removeOnComplete: { age: 3600, count: 1000 },
     removeOnFail: { age: 86400 },
   },
@@ -152,23 +152,39 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
 
     await job.updateProgress(40);
 
+    // Partition hypergraph nodes by type in a single pass; every phase below
+    // reuses these lists instead of re-filtering analysis.hypergraph.nodes.
+    const aduNodes: V3HypergraphNode[] = [];
+    const schemeNodes: V3HypergraphNode[] = [];
+    const ghostNodes: V3HypergraphNode[] = [];
+    for (const node of analysis.hypergraph.nodes) {
+      if (node.node_type === 'adu') aduNodes.push(node);
+      else if (node.node_type === 'scheme') schemeNodes.push(node);
+      else if (node.node_type === 'ghost') ghostNodes.push(node);
+    }
+
+    // Index edges by scheme node once, so per-scheme phases don't rescan every edge
+    const edgesBySchemeNodeId = new Map<string, V3HypergraphEdge[]>();
+    for (const edge of analysis.hypergraph.edges) {
+      const schemeEdges = edgesBySchemeNodeId.get(edge.scheme_node_id);
+      if (schemeEdges) schemeEdges.push(edge);
+      else edgesBySchemeNodeId.set(edge.scheme_node_id, [edge]);
+    }
+
     // 7. STEP A: Collect I-Node texts + all unique high_variance_terms,
     //    then embed them all in a single merged call.
-    const aduNodes = analysis.hypergraph.nodes.filter(
-      (n): n is V3HypergraphNode & { node_type: 'adu' } => n.node_type === 'adu'
-    );
 
     // Gather unique high-variance terms across all I-Nodes
-    const termToINodeEngineId = new Map<string, string>(); // term → first I-Node engine ID
+    const termToINode = new Map<string, V3HypergraphNode>(); // term → first I-Node containing it
     for (const aduNode of aduNodes) {
       const hvt: string[] = aduNode.high_variance_terms ?? [];
       for (const term of hvt) {
-        if (!termToINodeEngineId.has(term)) {
-          termToINodeEngineId.set(term, aduNode.node_id);
+        if (!termToINode.has(term)) {
+          termToINode.set(term, aduNode);
         }
       }
     }
-    const uniqueTerms = Array.from(termToINodeEngineId.keys());
+    const uniqueTerms = Array.from(termToINode.keys());
 
     // Build a merged list: [aduTexts..., termTexts...]
     const aduTexts = aduNodes.map(n => n.rewritten_text || n.text || '');
@@ -177,11 +193,24 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
 
     const iNodeEmbeddings = new Map<string, number[]>();
     const termEmbeddings = new Map<string, number[]>();
+    const valueEmbeddings = new Map<string, number[]>();
+
+    // Extracted values are embedded in a separate call (different content type),
+    // issued concurrently with the ADU/term call rather than after it.
+    // valueEmbeddings is keyed by text, so repeated values only need embedding once.
+    const valueTexts = Array.from(
+      new Set((analysis.extracted_values ?? []).map((v: { text: string }) => v.text))
+    );
 
     if (allTextsToEmbed.length > 0) {
       logger.info(`V3 worker: embedding ${allTextsToEmbed.length} texts (${aduTexts.length} ADUs + ${termTexts.length} terms)`, { sourceId });
-      const delayedAduTermEmbedResponse = await argumentService.embedTexts(allTextsToEmbed);
+    }
+    const [delayedAduTermEmbedResponse, delayedValueEmbedResponse] = await Promise.all([
+      allTextsToEmbed.length > 0 ? argumentService.embedTexts(allTextsToEmbed) : null,
+      valueTexts.length > 0 ? argumentService.embedTexts(valueTexts) : null,
+    ]);
 
+    if (delayedAduTermEmbedResponse) {
       if (delayedAduTermEmbedResponse.embeddings_1536.length !== allTextsToEmbed.length) {
         throw new Error(
           `embedTexts returned ${delayedAduTermEmbedResponse.embeddings_1536.length} vectors for ${allTextsToEmbed.length} inputs`
@@ -204,15 +233,11 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
 
     await job.updateProgress(60);
 
-    // 7. Generate embeddings for extracted values (separate call — different content type)
-    const valueEmbeddings = new Map<string, number[]>();
-    if (analysis.extracted_values && analysis.extracted_values.length > 0) {
-      const valueTexts = analysis.extracted_values.map((v: { text: string }) => v.text);
-      const delayedValueEmbedResponse = await argumentService.embedTexts(valueTexts);
-
-      for (let i = 0; i < analysis.extracted_values.length; i++) {
+    // 7. Collect embeddings for extracted values
+    if (delayedValueEmbedResponse) {
+      for (let i = 0; i < valueTexts.length; i++) {
         if (delayedValueEmbedResponse.embeddings_1536[i]) {
-          valueEmbeddings.set(analysis.extracted_values[i]!.text, delayedValueEmbedResponse.embeddings_1536[i]!);
+          valueEmbeddings.set(valueTexts[i]!, delayedValueEmbedResponse.embeddings_1536[i]!);
         }
       }
     }
@@ -246,9 +271,6 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
       // so parent_context_target_id returned by the engine is already a DB UUID.
       const parentINodeIdSet = new Set(parentINodes.map((n: { id: string; text: string }) => n.id));
 
-      const ghostNodes = analysis.hypergraph.nodes.filter(
-        (n: V3HypergraphNode) => n.node_type === 'ghost'
-      );
       for (const ghostNode of ghostNodes) {
         const parentTargetDbId = ghostNode.parent_context_target_id;
         if (!parentTargetDbId) continue;
@@ -310,9 +332,7 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
       // Build S-node → {premise DB IDs, conclusion DB IDs} from the analysis edges
       type SNodeEdges = { premises: string[]; conclusions: string[] };
       const sNodeEdgeMap = new Map<string, SNodeEdges>();
-      for (const schemeNode of analysis.hypergraph.nodes.filter(
-        (n: V3HypergraphNode) => n.node_type === 'scheme'
-      )) {
+      for (const schemeNode of schemeNodes) {
         const sDbId = engineIdToDbId.get(schemeNode.node_id);
         if (sDbId) sNodeEdgeMap.set(sDbId, { premises: [], conclusions: [] });
       }
@@ -384,14 +404,11 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
 
       // Build a set of engine IDs that appear as premises in SUPPORT or ATTACK scheme edges
       const premiseRoleMap = new Map<string, 'SUPPORT' | 'ATTACK'>(); // engine_id → role
-      const schemeNodes = analysis.hypergraph.nodes.filter(
-        (n: V3HypergraphNode) => n.node_type === 'scheme'
-      );
       for (const schemeNode of schemeNodes) {
         const direction = schemeNode.direction; // 'SUPPORT' | 'ATTACK'
         if (direction !== 'SUPPORT' && direction !== 'ATTACK') continue;
-        const premiseEdges = analysis.hypergraph.edges.filter(
-          (e: V3HypergraphEdge) => e.scheme_node_id === schemeNode.node_id && e.role === 'premise'
+        const premiseEdges = (edgesBySchemeNodeId.get(schemeNode.node_id) ?? []).filter(
+          (e: V3HypergraphEdge) => e.role === 'premise'
         );
         for (const edge of premiseEdges) {
           // If already mapped, first assignment wins
@@ -495,9 +512,6 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
     // ── Create replies from ghost nodes (assumption-bot) ──
     // Ghost replies are created for UX display but NOT re-enqueued for analysis
     // (cross-source edges are handled via parent_context_target_id above).
-    const ghostNodes = analysis.hypergraph.nodes.filter(
-      (n: V3HypergraphNode) => n.node_type === 'ghost'
-    );
     if (ghostNodes.length > 0) {
       let ghostPostId: string;
       let parentReplyId: string | undefined;
@@ -535,33 +549,33 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
 
     // ── I-Node Deduplication Phase ──
     // Runs after persistHypergraph so all I-nodes have stable DB UUIDs.
-    // D1. Parallel findSimilarINodesAcrossSource() per I-node (DB queries only)
+    // D1. Batched findSimilarINodesAcrossSourceBatch() for all I-nodes (one DB query)
     // D2. Filter to I-nodes that have ≥1 candidate
     // D3. Single HTTP call → deduplicateINodes() → discourse-engine fans out in parallel
     // D4. Validate: LLM-returned canonicalINodeId must be in the known candidate set
     // D5. setCanonicalINode() for confirmed duplicates
     try {
-      // D1: parallel DB candidate retrieval for all I-nodes with embeddings
+      // D1: batched DB candidate retrieval for all I-nodes with embeddings
       type INodeDedupCandidate = { id: string; content: string; epistemic_type: string; similarity: number };
       const candidatesPerDbId = new Map<string, INodeDedupCandidate[]>();
 
-      await Promise.all(
-        aduNodes.map(async (aduNode) => {
-          const dbId = engineIdToDbId.get(aduNode.node_id);
-          if (!dbId) return;
-          const embedding = iNodeEmbeddings.get(aduNode.node_id);
-          if (!embedding) return;
-
-          const similar = await v3Repo.findSimilarINodesAcrossSource(
-            embedding,
-            sourceType,
-            sourceId,
-            0.78,
-            5
-          );
-          candidatesPerDbId.set(dbId, similar);
-        })
+      const dedupTargets: Array<{ dbId: string; embedding: number[] }> = [];
+      for (const aduNode of aduNodes) {
+        const dbId = engineIdToDbId.get(aduNode.node_id);
+        const embedding = iNodeEmbeddings.get(aduNode.node_id);
+        if (dbId && embedding) dedupTargets.push({ dbId, embedding });
+      }
+
+      const similarPerTarget = await v3Repo.findSimilarINodesAcrossSourceBatch(
+        dedupTargets.map(t => t.embedding),
+        sourceType,
+        sourceId,
+        0.78,
+        5
       );
+      dedupTargets.forEach((t, i) => {
+        candidatesPerDbId.set(t.dbId, similarPerTarget[i] ?? []);
+      });
 
       // D2: only process I-nodes that have at least one candidate
       const iNodesWithCandidates = aduNodes.filter(aduNode => {
@@ -596,7 +610,7 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
         const dedupResults = await argumentService.deduplicateINodes(truncatedContext, dedupInputs);
 
         // D4 + D5: validate and persist
-        let actualPersistedCount = 0;
+        const duplicates: Array<{ iNodeId: string; canonicalINodeId: string }> = [];
         for (const result of dedupResults) {
           if (!result.canonicalINodeId || result.dedupFailed) continue;
 
@@ -613,11 +627,14 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
           }
 
           await v3Repo.setCanonicalINode(result.newINodeId, result.canonicalINodeId);
-          logger.info(`V3 dedup: marked ${result.newINodeId} as duplicate of ${result.canonicalINodeId}`, { sourceId });
-          actualPersistedCount++;
+          duplicates.push({ iNodeId: result.newINodeId, canonicalINodeId: result.canonicalINodeId });
         }
 
-        logger.info(`V3 dedup: ${actualPersistedCount}/${iNodesWithCandidates.length} I-nodes deduplicated`, { sourceId });
+        // One summary line per job rather than one line per duplicate
+        logger.info(`V3 dedup: ${duplicates.length}/${iNodesWithCandidates.length} I-nodes deduplicated`, {
+          sourceId,
+          duplicates,
+        });
       } else {
         logger.info('V3 dedup: no cross-source candidates found, all I-nodes are novel', { sourceId });
       }
@@ -634,36 +651,36 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
     if (uniqueTerms.length > 0) {
       logger.info(`V3: Concept phase — ${uniqueTerms.length} unique terms`, { sourceId });
 
-      // STEP B: Parallel DB candidate retrieval (local DB, no HTTP)
+      // STEP B: Batched DB candidate retrieval — one query for all embedded terms (local DB, no HTTP)
       const candidatesPerTerm = new Map<string, Array<{
         id: string; term: string; definition: string; sampleINodeText: string;
       }>>();
 
-      await Promise.all(
-        uniqueTerms.map(async (term) => {
-          const embedding = termEmbeddings.get(term);
-          if (!embedding) {
-            candidatesPerTerm.set(term, []);
-            return;
-          }
-          const similar = await v3Repo.findSimilarConcepts(embedding, 0.85, 3);
-          candidatesPerTerm.set(
-            term,
-            similar.map(c => ({
-              id: c.id,
-              term: c.term,
-              definition: c.definition,
-              sampleINodeText: c.sampleINodeText,
-            }))
-          );
-        })
+      const embeddedTerms = uniqueTerms.filter(term => termEmbeddings.has(term));
+      const similarPerTerm = await v3Repo.findSimilarConceptsBatch(
+        embeddedTerms.map(term => termEmbeddings.get(term)!),
+        0.85,
+        3
       );
+      for (const term of uniqueTerms) {
+        candidatesPerTerm.set(term, []);
+      }
+      embeddedTerms.forEach((term, i) => {
+        candidatesPerTerm.set(
+          term,
+          (similarPerTerm[i] ?? []).map(c => ({
+            id: c.id,
+            term: c.term,
+            definition: c.definition,
+            sampleINodeText: c.sampleINodeText,
+          }))
+        );
+      });
 
       // Build per-term disambiguation inputs (term → I-Node text)
       // Use the first I-Node that contains each term (rewritten_text preferred)
       const termDisambInputs = uniqueTerms.map(term => {
-        const iNodeEngineId = termToINodeEngineId.get(term)!;
-        const iNodeNode = aduNodes.find(n => n.node_id === iNodeEngineId);
+        const iNodeNode = termToINode.get(term);
         const targetINodeText: string = iNodeNode?.rewritten_text || iNodeNode?.text || term;
         return {
           term,
@@ -752,19 +769,15 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
           iNodeTermConcept.get(mapping.i_node_id)!.set(mapping.term_text, mapping.concept_id);
         }
 
-        // For each scheme node, check premise/conclusion I-Node pairs for equivocation
-        const schemeNodes = analysis.hypergraph.nodes.filter(
-          (n): n is V3HypergraphNode & { node_type: 'scheme' } => n.node_type === 'scheme'
-        );
-
+        // For each scheme node, check premise/conclusion I-Node pairs for equivocation.
+        // Flags are collected first and written below in bounded concurrent chunks.
+        const equivocationFlags: Array<Parameters<typeof v3Repo.createEquivocationFlag>> = [];
         for (const schemeNode of schemeNodes) {
           const schemeDbId = engineIdToDbId.get(schemeNode.node_id);
           if (!schemeDbId) continue;
 
           // Get premise and conclusion I-Node db IDs via edges
-          const schemeEdges = analysis.hypergraph.edges.filter(
-            (e: V3HypergraphEdge) => e.scheme_node_id === schemeNode.node_id
-          );
+          const schemeEdges = edgesBySchemeNodeId.get(schemeNode.node_id) ?? [];
 
           if (schemeEdges.length === 0) {
             logger.debug(`V3: No edges found for scheme node ${schemeNode.node_id}, skipping equivocation check`);
@@ -786,6 +799,9 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
           const conclusionConcepts = iNodeTermConcept.get(conclusionDbId);
           if (!conclusionConcepts) continue;
 
+          // Keep the first premise per term, as the (scheme_node_id, term)
+          // conflict target would have done with sequential inserts
+          const flaggedTerms = new Set<string>();
           for (const premiseDbId of premiseDbIds) {
             const premiseConcepts = iNodeTermConcept.get(premiseDbId);
             if (!premiseConcepts) continue;
@@ -793,19 +809,28 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
             // Find shared terms where the concept differs (equivocation)
             for (const [term, premiseConceptId] of premiseConcepts) {
               const conclusionConceptId = conclusionConcepts.get(term);
-              if (conclusionConceptId && conclusionConceptId !== premiseConceptId) {
-                await v3Repo.createEquivocationFlag(
+              if (conclusionConceptId && conclusionConceptId !== premiseConceptId && !flaggedTerms.has(term)) {
+                flaggedTerms.add(term);
+                equivocationFlags.push([
                   schemeDbId,
                   term,
                   premiseDbId,
                   conclusionDbId,
                   premiseConceptId,
-                  conclusionConceptId
-                );
+                  conclusionConceptId,
+                ]);
               }
             }
           }
         }
+
+        // Chunk concurrent DB mutations to avoid overwhelming the connection pool
+        const CHUNK_SIZE = 50;
+        for (let i = 0; i < equivocationFlags.length; i += CHUNK_SIZE) {
+          await Promise.all(
+            equivocationFlags.slice(i, i + CHUNK_SIZE).map(args => v3Repo.createEquivocationFlag(...args))
+          );
+        }
       }
     }
 
@@ -815,8 +840,8 @@ export async function processV3Analysis(job: Job<V3AnalysisJobData>): Promise<vo
 
     logger.info(`V3 analysis completed for ${sourceId}`, {
       iNodes: aduNodes.length,
-      sNodes: analysis.hypergraph.nodes.filter((n: V3HypergraphNode) => n.node_type === 'scheme').length,
-      ghosts: analysis.hypergraph.nodes.filter((n: V3HypergraphNode) => n.node_type === 'ghost').length,
+      sNodes: schemeNodes.length,
+      ghosts: ghostNodes.length,
       edges: analysis.hypergraph.edges.length,
       socraticQuestions: analysis.socratic_questions?.length ?? 0,
       uniqueConceptTerms: uniqueTerms.length,
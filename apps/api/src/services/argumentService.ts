@@ -1,6 +1,7 @@
 import { Agent } from 'undici';
 import { logger } from '../logger.js';
 import { config } from '../config.js';
+import { getCachedSearchEmbedding, cacheSearchEmbedding } from '../cache/searchEmbeddingCache.js';
 import type { V3AnalyzeTextResponse } from '@chitin/shared';
 
 const undiciAgent = new Agent({ headersTimeout: 0, bodyTimeout: 0 });
@@ -68,14 +69,21 @@ class DiscourseEngineService {
 
   /**
    * Embed a single search query for semantic search.
-   * Called synchronously in the request-response cycle.
+   * Called synchronously in the request-response cycle, so repeated queries
+   * are served from an in-process LRU cache instead of re-embedding.
    */
   async embedSearchQuery(query: string): Promise<number[]> {
+    const cached = getCachedSearchEmbedding(query);
+    if (cached) {
+      return cached;
+    }
+
     const response = await this._requestEmbeddings([query]);
     const embedding = response.embeddings_1536[0];
     if (!embedding) {
       throw new Error('Failed to generate realtime search embedding');
     }
+    cacheSearchEmbedding(query, embedding);
     return embedding;
   }
 
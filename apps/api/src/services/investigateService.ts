@@ -141,9 +141,11 @@ function calculateHingeCentrality(
   for (const id of nodeIds) {
     adj.set(id, []);
   }
+  // adj is keyed by every node ID, so it doubles as an O(1) membership check
   for (const edge of schemeEdges) {
-    if (nodeIds.includes(edge.from_node_id) && nodeIds.includes(edge.to_node_id)) {
-      adj.get(edge.from_node_id)?.push(edge.to_node_id);
+    const out = adj.get(edge.from_node_id);
+    if (out && adj.has(edge.to_node_id)) {
+      out.push(edge.to_node_id);
     }
   }
 
@@ -209,6 +211,11 @@ function calculateHingeCentrality(
  * Simple K-Means clustering on high-dimensional embedding vectors.
  * Used to enforce viewpoint diversity in the final ranked output.
  * Returns cluster ID (0..k-1) for each node in the same order as `nodes`.
+ *
+ * Vectors and centroids are packed into contiguous row-major Float64Arrays
+ * so the distance loops walk flat memory instead of nested number[] rows.
+ * Row norms are computed once up front and centroid norms once per update,
+ * leaving a single dot product per distance evaluation.
  */
 function kMeansClustering(
   embeddings: Array<number[] | null>,
@@ -221,110 +228,153 @@ function kMeansClustering(
 
   // Filter to nodes that have embeddings; assign cluster 0 to those without
   const validIndices: number[] = [];
-  const validEmbeddings: number[][] = [];
   for (let i = 0; i < n; i++) {
     if (embeddings[i] !== null && embeddings[i]!.length > 0) {
       validIndices.push(i);
-      validEmbeddings.push(embeddings[i]!);
     }
   }
 
-  if (validEmbeddings.length === 0) {
+  if (validIndices.length === 0) {
     // No embeddings: assign round-robin clusters
     return embeddings.map((_, i) => i % k);
   }
 
-  const dim = validEmbeddings[0]!.length;
-  const assignments = new Array<number>(validEmbeddings.length).fill(0);
+  const rows = validIndices.length;
+  const dim = embeddings[validIndices[0]!]!.length;
+
+  // Pack valid embeddings into a single (rows × dim) matrix
+  const matrix = new Float64Array(rows * dim);
+  for (let r = 0; r < rows; r++) {
+    const v = embeddings[validIndices[r]!]!;
+    const offset = r * dim;
+    for (let d = 0; d < dim; d++) {
+      matrix[offset + d] = v[d] ?? 0;
+    }
+  }
+
+  const rowNorms = new Float64Array(rows);
+  for (let r = 0; r < rows; r++) {
+    rowNorms[r] = l2Norm(matrix, r * dim, dim);
+  }
+
+  const assignments = new Array<number>(rows).fill(0);
 
   // Initialize centroids by picking k spread-out starting points (kmeans++ style)
-  const centroids: number[][] = [validEmbeddings[0]!.slice()];
-  for (let c = 1; c < Math.min(k, validEmbeddings.length); c++) {
-    const distances = validEmbeddings.map(v => {
-      let minDist = Infinity;
-      for (const centroid of centroids) {
-        const dist = cosineDist(v, centroid);
-        if (dist < minDist) minDist = dist;
-      }
-      return minDist;
-    });
+  const maxClusters = Math.min(k, rows);
+  const centroids = new Float64Array(maxClusters * dim);
+  const centroidNorms = new Float64Array(maxClusters);
+  centroids.set(matrix.subarray(0, dim), 0);
+  centroidNorms[0] = rowNorms[0]!;
+  let numClusters = 1;
+  while (numClusters < maxClusters) {
     // Pick the point with highest min-distance to existing centroids
     let maxDist = -1;
     let pick = 0;
-    for (let i = 0; i < distances.length; i++) {
-      if (distances[i]! > maxDist) {
-        maxDist = distances[i]!;
-        pick = i;
+    for (let r = 0; r < rows; r++) {
+      let minDist = Infinity;
+      for (let c = 0; c < numClusters; c++) {
+        const dist = cosineDist(
+          matrix, r * dim, rowNorms[r]!, centroids, c * dim, centroidNorms[c]!, dim
+        );
+        if (dist < minDist) minDist = dist;
+      }
+      if (minDist > maxDist) {
+        maxDist = minDist;
+        pick = r;
       }
     }
-    centroids.push(validEmbeddings[pick]!.slice());
+    centroids.set(matrix.subarray(pick * dim, (pick + 1) * dim), numClusters * dim);
+    centroidNorms[numClusters] = rowNorms[pick]!;
+    numClusters++;
   }
 
-  const numClusters = centroids.length;
+  const sums = new Float64Array(numClusters * dim);
+  const counts = new Array<number>(numClusters);
 
   for (let iter = 0; iter < maxIterations; iter++) {
     let changed = false;
 
     // Assignment step
-    for (let i = 0; i < validEmbeddings.length; i++) {
+    for (let r = 0; r < rows; r++) {
       let bestCluster = 0;
       let bestDist = Infinity;
       for (let c = 0; c < numClusters; c++) {
-        const dist = cosineDist(validEmbeddings[i]!, centroids[c]!);
+        const dist = cosineDist(
+          matrix, r * dim, rowNorms[r]!, centroids, c * dim, centroidNorms[c]!, dim
+        );
         if (dist < bestDist) {
           bestDist = dist;
           bestCluster = c;
         }
       }
-      if (assignments[i] !== bestCluster) {
-        assignments[i] = bestCluster;
+      if (assignments[r] !== bestCluster) {
+        assignments[r] = bestCluster;
         changed = true;
       }
     }
 
     if (!changed) break;
 
-    // Update step: recompute centroids
+    // Update step: recompute centroids from per-cluster sums in a single pass
+    sums.fill(0);
+    counts.fill(0);
+    for (let r = 0; r < rows; r++) {
+      const c = assignments[r]!;
+      counts[c] = counts[c]! + 1;
+      const rowOffset = r * dim;
+      const sumOffset = c * dim;
+      for (let d = 0; d < dim; d++) {
+        sums[sumOffset + d]! += matrix[rowOffset + d]!;
+      }
+    }
     for (let c = 0; c < numClusters; c++) {
-      const members = validEmbeddings.filter((_, i) => assignments[i] === c);
-      if (members.length > 0) {
-        const newCentroid = new Array<number>(dim).fill(0);
-        for (const v of members) {
-          for (let d = 0; d < dim; d++) {
-            newCentroid[d]! += v[d]!;
-          }
-        }
+      const count = counts[c]!;
+      if (count > 0) {
+        const offset = c * dim;
         for (let d = 0; d < dim; d++) {
-          newCentroid[d]! /= members.length;
+          centroids[offset + d] = sums[offset + d]! / count;
         }
-        centroids[c] = newCentroid;
+        centroidNorms[c] = l2Norm(centroids, offset, dim);
       }
     }
   }
 
   // Map assignments back to original indices
   const result = new Array<number>(n).fill(0);
-  let validIdx = 0;
-  for (let i = 0; i < n; i++) {
-    if (embeddings[i] !== null && embeddings[i]!.length > 0) {
-      result[i] = assignments[validIdx]!;
-      validIdx++;
-    } else {
-      result[i] = 0;
-    }
+  for (let r = 0; r < rows; r++) {
+    result[validIndices[r]!] = assignments[r]!;
   }
   return result;
 }
 
-function cosineDist(a: number[], b: number[]): number {
-  let dot = 0, magA = 0, magB = 0;
-  for (let i = 0; i < a.length; i++) {
-    dot += a[i]! * b[i]!;
-    magA += a[i]! * a[i]!;
-    magB += b[i]! * b[i]!;
+function l2Norm(v: Float64Array, offset: number, dim: number): number {
+  let sumSq = 0;
+  for (let d = 0; d < dim; d++) {
+    const x = v[offset + d]!;
+    sumSq += x * x;
   }
-  const denom = Math.sqrt(magA) * Math.sqrt(magB);
+  return Math.sqrt(sumSq);
+}
+
+/**
+ * Cosine distance between two `dim`-length rows stored at offsets in flat
+ * arrays, given their precomputed L2 norms.
+ */
+function cosineDist(
+  a: Float64Array,
+  aOffset: number,
+  aNorm: number,
+  b: Float64Array,
+  bOffset: number,
+  bNorm: number,
+  dim: number
+): number {
+  const denom = aNorm * bNorm;
   if (denom === 0) return 1;
+  let dot = 0;
+  for (let d = 0; d < dim; d++) {
+    dot += a[aOffset + d]! * b[bOffset + d]!;
+  }
   return 1 - dot / denom;
 }
 